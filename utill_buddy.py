@@ -9,20 +9,25 @@ Everything runs silently – no main window, only a tray icon.
 """
 
 import sys
-import threading
-import time
-import platform
+import json
 import logging
+import os
 import random
-from typing import Dict, Callable, Optional
-import pyautogui
-from pystray import Icon, MenuItem, Menu
-from PIL import Image, ImageDraw
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Callable, Optional
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QFileDialog, QMessageBox, QInputDialog, QShortcut
+    QApplication, QWidget, QDialog, QFileDialog, QMessageBox, QInputDialog,
+    QShortcut, QMenu, QSystemTrayIcon
 )
-from PyQt5.QtGui import QKeySequence, QImage
-from PyQt5.QtCore import QTimer, Qt, QObject, pyqtSignal
+from PyQt5.QtGui import QClipboard, QIcon, QKeySequence, QImage, QImageReader, QPixmap
+from PyQt5.QtCore import QTimer, Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+
+# pyautogui and PIL are imported where they are first used, so startup
+# only pays for Qt.
+if TYPE_CHECKING:
+    from PIL import Image
 
 # Configure logging
 logging.basicConfig(
@@ -33,100 +38,163 @@ logger = logging.getLogger(__name__)
 
 APP_NAME = "Utill Buddy"
 DEFAULT_JIGGLE_INTERVAL = 60  # seconds
-MAX_RETRIES = 3  # For clipboard operations
+SHORTCUTS_FILE = Path.home() / ".utill_buddy.json"  # Saved user shortcuts
+IS_DARWIN = sys.platform == "darwin"
+_CMD = "Meta" if IS_DARWIN else "Ctrl"  # Primary shortcut modifier
+DEFAULT_SHORTCUTS = MappingProxyType({  # Read-only; copy before editing
+    "copy": f"{_CMD}+C",
+    "paste": f"{_CMD}+V",
+    "cut": f"{_CMD}+X",
+    "copy_image": f"{_CMD}+Shift+C",
+    "paste_image": f"{_CMD}+Shift+V",
+})
+
+# Tray title / jiggler menu text for each jiggler state
+_TITLE_ON = f"{APP_NAME} - Jiggler: On"
+_TITLE_OFF = f"{APP_NAME} - Jiggler: Off"
+_LABEL_ON = "✔ Jiggler: On"
+_LABEL_OFF = "◼ Jiggler: Off"
 
 # ────────────────────────────────────────────────────────────────────
 # Mouse-jiggler
 # ────────────────────────────────────────────────────────────────────
-class MouseJiggler:
-    """Keeps the pointer moving so the system doesn't sleep/lock."""
+class MouseJiggler(QObject):
+    """Keeps the pointer moving so the system doesn't sleep/lock.
+
+    Jiggles are driven by a QTimer on the Qt event loop.
+    """
 
     def __init__(self, interval: int = DEFAULT_JIGGLE_INTERVAL):
+        super().__init__()
         self.interval = interval
-        self.jiggle_event = threading.Event()
-        self.stop_event = threading.Event()
-        self.thread: Optional[threading.Thread] = None
-        self._start_jiggling_immediately = False
-        self._screen_width, self._screen_height = pyautogui.size()
-
-    def _get_random_offset(self) -> tuple[int, int]:
-        """Generate small random movement within screen bounds."""
-        x, y = pyautogui.position()
-        new_x = max(0, min(x + random.randint(-5, 5), self._screen_width - 1)
-        new_y = max(0, min(y + random.randint(-5, 5), self._screen_height - 1)
-        return (new_x, new_y)
+        self._running = False
+        self._rng = random.Random()
+        # Pointer position at the previous tick; None forces the next jiggle
+        self._last_pos: Optional[tuple[int, int]] = None
+        self._jiggled = False  # Whether the previous tick jiggled
+        # Queried on the first jiggle rather than at startup
+        self._screen_width: Optional[int] = None
+        self._screen_height: Optional[int] = None
+
+        # Ticks come every half interval so user movement is noticed in time
+        # to still jiggle within `interval` of the last input.
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval * 500)
+        self._timer.timeout.connect(self._move_mouse)
+
+    def _clip(self, x: int, y: int) -> tuple[int, int]:
+        """Clamp a point to the screen bounds."""
+        if self._screen_width is None:
+            import pyautogui
+            self._screen_width, self._screen_height = pyautogui.size()
+        return (
+            max(0, min(x, self._screen_width - 1)),
+            max(0, min(y, self._screen_height - 1)),
+        )
 
     def _move_mouse(self) -> None:
-        """Move mouse in a small random pattern."""
+        """Nudge the mouse a few pixels, then put it back.
+
+        Skipped when there was input (the user's or our own jiggle) in the
+        last half interval, so the system is never idle for longer than
+        ``interval``.
+        """
         try:
-            x, y = self._get_random_offset()
-            pyautogui.moveTo(x, y, duration=0.1)
-            time.sleep(0.1)
-            pyautogui.moveTo(*self._get_random_offset(), duration=0.1)
+            import pyautogui
+            x, y = pyautogui.position()
+            if self._last_pos is not None and ((x, y) != self._last_pos or self._jiggled):
+                self._last_pos = (x, y)
+                self._jiggled = False
+                return
+            # duration=0 -> a single platform move, no tween loop; _pause=False
+            # skips pyautogui's 0.1 s post-call sleep on the GUI thread
+            nx, ny = self._clip(x + self._rng.randint(-5, 5), y + self._rng.randint(-5, 5))
+            pyautogui.moveTo(nx, ny, _pause=False)
+            pyautogui.moveTo(x, y, _pause=False)
+            self._last_pos = (x, y)
+            self._jiggled = True
         except Exception as exc:
-            logger.error(f"Mouse movement failed: {exc}")
-
-    def _loop(self) -> None:
-        """Main jiggling loop."""
-        if self._start_jiggling_immediately:
-            self.jiggle_event.set()
-            self._start_jiggling_immediately = False
-
-        while not self.stop_event.is_set():
-            if self.jiggle_event.is_set():
-                self._move_mouse()
-
-            for _ in range(self.interval):
-                if self.stop_event.is_set():
-                    break
-                time.sleep(1)
+            logger.error("Mouse movement failed: %s", exc)
 
     def start(self, jiggle_on_start: bool = True) -> None:
-        """Start the jiggler thread."""
-        self.jiggle_event.set()
-        if self.thread is None or not self.thread.is_alive():
-            self.stop_event.clear()
-            self._start_jiggling_immediately = jiggle_on_start
-            self.thread = threading.Thread(target=self._loop, daemon=True)
-            self.thread.start()
-            logger.info("Mouse jiggler started")
+        """Start jiggling."""
+        self._running = True
+        if not self._timer.isActive():
+            self._timer.start()
+            self._last_pos = None
+            if jiggle_on_start:
+                self._move_mouse()
+        logger.info("Mouse jiggler started")
 
     def pause(self) -> None:
         """Pause jiggling."""
-        self.jiggle_event.clear()
+        self._running = False
+        self._timer.stop()
         logger.info("Mouse jiggler paused")
 
     def is_running(self) -> bool:
         """Check if jiggler is active."""
-        return self.jiggle_event.is_set()
+        return self._running
 
     def stop(self) -> None:
         """Stop the jiggler completely."""
-        self.jiggle_event.clear()
-        self.stop_event.set()
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=self.interval + 2)
-        self.thread = None
+        self._running = False
+        self._timer.stop()
         logger.info("Mouse jiggler stopped")
 
 
+# ────────────────────────────────────────────────────────────────────
+# Dialog helpers
+# ────────────────────────────────────────────────────────────────────
+_input_dialog: Optional[QInputDialog] = None  # Built on first prompt
+
+def _get_text(title: str, label: str, text: str = "") -> tuple[str, bool]:
+    """Like QInputDialog.getText(), but reuses a single dialog instance."""
+    global _input_dialog
+    if _input_dialog is None:
+        _input_dialog = QInputDialog()
+        _input_dialog.setInputMode(QInputDialog.TextInput)
+    elif _input_dialog.isVisible():
+        # Already prompting (e.g. Copy Text during Set Shortcut); leave that
+        # prompt alone and ask in a dialog of our own.
+        return QInputDialog.getText(None, title, label, text=text)
+
+    _input_dialog.setWindowTitle(title)
+    _input_dialog.setLabelText(label)
+    _input_dialog.setTextValue(text)
+    # exec_() returns -1 on a recursive call, so test for Accepted explicitly
+    ok = _input_dialog.exec_() == QDialog.Accepted
+    return _input_dialog.textValue(), ok
+
+_tray: Optional[QSystemTrayIcon] = None  # Set by start_tray once the icon is up
+_tray_menu: Optional[QMenu] = None  # Kept alive for the tray's context menu
+
+def _notify(title: str, message: str) -> None:
+    """Acknowledge an action without blocking on a modal message box.
+
+    Uses a tray balloon/notification when the platform supports them and
+    falls back to QMessageBox otherwise (e.g. before the tray is up).
+    """
+    if _tray is not None and _tray.supportsMessages():
+        _tray.showMessage(title, message)
+    else:
+        QMessageBox.information(None, title, message)
+
+
 # ────────────────────────────────────────────────────────────────────
 # Shortcut manager
 # ────────────────────────────────────────────────────────────────────
 class ShortcutManager:
     """Manages application-wide keyboard shortcuts."""
 
+    # Parsed sequences, shared across instances (QKeySequence is immutable)
+    _seq_cache: Dict[str, QKeySequence] = {}
+
     def __init__(self, app: QApplication, handlers: Dict[str, Callable]):
         self.app = app
         self.handlers = handlers
-        self.default_map = {
-            "copy": "Meta+C" if platform.system() == "Darwin" else "Ctrl+C",
-            "paste": "Meta+V" if platform.system() == "Darwin" else "Ctrl+V",
-            "cut": "Meta+X" if platform.system() == "Darwin" else "Ctrl+X",
-            "copy_image": "Meta+Shift+C" if platform.system() == "Darwin" else "Ctrl+Shift+C",
-            "paste_image": "Meta+Shift+V" if platform.system() == "Darwin" else "Ctrl+Shift+V",
-        }
-        self.user_map: Dict[str, str] = dict(self.default_map)
+        self.default_map = DEFAULT_SHORTCUTS
+        self.user_map: Dict[str, str] = self._load_user_map()
         self.shortcuts: Dict[str, QShortcut] = {}
 
         # Invisible parent widget for shortcuts
@@ -134,32 +202,87 @@ class ShortcutManager:
         self.parent_widget.setWindowFlags(Qt.Widget | Qt.FramelessWindowHint)
         self.parent_widget.setAttribute(Qt.WA_TranslucentBackground)
         self.parent_widget.hide()
+        # Shortcuts are registered by register_all(); the caller invokes it
+        # once the event loop is running (main() schedules it).
 
-        self._create_all()
-
-    def _create_all(self) -> None:
+    def _load_user_map(self) -> Dict[str, str]:
+        """Load saved shortcuts, falling back to the defaults."""
+        try:
+            with open(SHORTCUTS_FILE, encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return dict(self.default_map)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not load shortcuts from %s: %s", SHORTCUTS_FILE, exc)
+            return dict(self.default_map)
+
+        if not isinstance(saved, dict):
+            logger.warning("Ignoring malformed shortcuts file %s", SHORTCUTS_FILE)
+            return dict(self.default_map)
+        user_map = {}
+        for action, seq in saved.items():
+            if isinstance(seq, str):
+                user_map[action] = seq
+            else:
+                logger.warning("Ignoring non-string shortcut for %s: %r", action, seq)
+        return user_map
+
+    def _save_user_map(self) -> None:
+        """Persist the current shortcuts so they survive a restart."""
+        # Write a sibling temp file and swap it in, so a crash or full disk
+        # mid-write never leaves a truncated file behind.
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=SHORTCUTS_FILE.parent,
+                prefix=SHORTCUTS_FILE.name, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(self.user_map, f, indent=2)
+            os.replace(tmp_path, SHORTCUTS_FILE)
+        except OSError as exc:
+            logger.error("Could not save shortcuts to %s: %s", SHORTCUTS_FILE, exc)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def register_all(self) -> None:
         """Create all shortcuts from current mapping."""
         for action, seq_str in self.user_map.items():
             self._register_shortcut(action, seq_str)
 
-    def _register_shortcut(self, action: str, sequence_str: str) -> None:
+    def _key_sequence(self, sequence_str: str) -> QKeySequence:
+        """Return the parsed sequence for a string, parsing it only once."""
+        qseq = self._seq_cache.get(sequence_str)
+        if qseq is None:
+            qseq = self._seq_cache[sequence_str] = QKeySequence(sequence_str)
+        return qseq
+
+    def _register_shortcut(
+        self, action: str, sequence_str: str, qseq: Optional[QKeySequence] = None
+    ) -> None:
         """Register a single shortcut."""
         if action not in self.handlers:
-            logger.warning(f"No handler for action: {action}")
+            logger.warning("No handler for action: %s", action)
             return
 
-        qseq = QKeySequence(sequence_str)
+        if qseq is None:
+            qseq = self._key_sequence(sequence_str)
         if qseq.isEmpty():
-            logger.error(f"Invalid sequence '{sequence_str}' for {action}")
+            logger.error("Invalid sequence '%s' for %s", sequence_str, action)
             return
 
         try:
             # Corrected shortcut initialization
             shortcut = QShortcut(qseq, self.parent_widget, self.handlers[action])
+            # Holding the keys must not reopen the action's dialog repeatedly
+            shortcut.setAutoRepeat(False)
             self.shortcuts[action] = shortcut
-            logger.info(f"Registered shortcut: {action} -> {sequence_str}")
+            logger.info("Registered shortcut: %s -> %s", action, sequence_str)
         except Exception as exc:
-            logger.error(f"Failed to set shortcut {action}: {exc}")
+            logger.error("Failed to set shortcut %s: %s", action, exc)
 
     def set_shortcut(self, action: str) -> None:
         """Prompt user to set a new shortcut."""
@@ -168,31 +291,49 @@ class ShortcutManager:
             return
 
         current = self.user_map.get(action, "")
-        seq_str, ok = QInputDialog.getText(
-            None, "Set Shortcut",
+        seq_str, ok = _get_text(
+            "Set Shortcut",
             f"Shortcut for '{action}' (e.g., Ctrl+Shift+X).\nCurrent: '{current}':",
             text=current
         )
         if not ok:
             return
 
-        # Remove existing shortcut
-        if action in self.shortcuts:
-            self.shortcuts[action].setEnabled(False)
-            del self.shortcuts[action]
-
         if not seq_str:
+            # Keep the object; an empty key never fires and is cheap to rebind
+            if action in self.shortcuts:
+                self.shortcuts[action].setKey(QKeySequence())
             self.user_map.pop(action, None)
-            QMessageBox.information(None, "Shortcut cleared", f"'{action}' shortcut removed")
+            self._save_user_map()
+            _notify("Shortcut cleared", f"'{action}' shortcut removed")
             return
 
-        if QKeySequence(seq_str).isEmpty():
+        qseq = self._key_sequence(seq_str)
+        if qseq.isEmpty():
             QMessageBox.warning(None, "Invalid", f"'{seq_str}' is not a valid shortcut")
             return
 
-        self._register_shortcut(action, seq_str)
+        # QKeySequence equality is canonical, so "ctrl+c" matches "Ctrl+C"
+        clash = next(
+            (other for other, sc in self.shortcuts.items()
+             if other != action and sc.key() == qseq),
+            None,
+        )
+        if clash is not None:
+            QMessageBox.warning(
+                None, "Shortcut in use", f"'{seq_str}' is already assigned to '{clash}'"
+            )
+            return
+
+        if action in self.shortcuts:
+            # Rebind in place; the activated connection is kept
+            self.shortcuts[action].setKey(qseq)
+            logger.info("Updated shortcut: %s -> %s", action, seq_str)
+        else:
+            self._register_shortcut(action, seq_str, qseq)
         self.user_map[action] = seq_str
-        QMessageBox.information(None, "Shortcut set", f"{action} → {seq_str}")
+        self._save_user_map()
+        _notify("Shortcut set", f"{action} → {seq_str}")
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -206,36 +347,52 @@ class Signals(QObject):
     copy_image = pyqtSignal()
     paste_image = pyqtSignal()
     custom_shortcut = pyqtSignal(str)
+    image_loaded = pyqtSignal(QImage, str)  # image (null on failure), error text
+    image_saved = pyqtSignal(str, bool)  # path, success
 
 
 signals = Signals()
 
+# (action, menu icon, label) for each clipboard action, in menu order
+MENU_ACTIONS = (
+    ("copy", "📋", "Copy Text"),
+    ("paste", "📋", "Paste Text"),
+    ("cut", "✂", "Cut Text"),
+    ("copy_image", "🖼", "Copy Image"),
+    ("paste_image", "🖼", "Paste Image"),
+)
+CLIPBOARD_ACTIONS = tuple(name for name, _, _ in MENU_ACTIONS)
+
+
+def _shortcut_emitter(action: str) -> Callable[[], None]:
+    """Zero-argument callable that asks to rebind ``action``.
+
+    Bound in a closure rather than a default argument, which Qt would fill
+    with QAction.triggered's ``checked`` flag.
+    """
+    return lambda: signals.custom_shortcut.emit(action)
+
+
+# Built once at import; the tray menu reuses these callables
+_SHORTCUT_EMIT: Dict[str, Callable[[], None]] = {
+    name: _shortcut_emitter(name) for name in CLIPBOARD_ACTIONS
+}
+
 # ────────────────────────────────────────────────────────────────────
 # Clipboard helpers
 # ────────────────────────────────────────────────────────────────────
-def _with_retry(func: Callable, *args, **kwargs) -> bool:
-    """Helper to retry clipboard operations."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            func(*args, **kwargs)
-            return True
-        except Exception as e:
-            logger.warning(f"Attempt {attempt + 1} failed: {e}")
-            time.sleep(0.1)
-    return False
+_clipboard: Optional[QClipboard] = None  # Bound in main() once the app exists
 
 def copy_text() -> None:
     """Copy text to clipboard with user input."""
-    text, ok = QInputDialog.getText(None, "Copy Text", "Enter text:")
+    text, ok = _get_text("Copy Text", "Enter text:")
     if ok and text:
-        if _with_retry(QApplication.clipboard().setText, text):
-            QMessageBox.information(None, "Copied", "Text copied to clipboard")
-        else:
-            QMessageBox.warning(None, "Error", "Failed to copy text")
+        _clipboard.setText(text)
+        _notify("Copied", "Text copied to clipboard")
 
 def paste_text() -> None:
     """Paste text from clipboard."""
-    text = QApplication.clipboard().text()
+    text = _clipboard.text()
     if text:
         QMessageBox.information(None, "Clipboard Text", text)
     else:
@@ -243,32 +400,58 @@ def paste_text() -> None:
 
 def cut_text() -> None:
     """Cut text (copy then clear clipboard)."""
-    text = QApplication.clipboard().text()
+    text = _clipboard.text()
     if text:
-        if _with_retry(QApplication.clipboard().clear):
-            QMessageBox.information(None, "Cut Text", f"Cut: {text}")
-        else:
-            QMessageBox.warning(None, "Error", "Failed to cut text")
+        _clipboard.clear()
+        # Not the text itself: notifications linger in the OS history
+        _notify("Cut Text", "Text cut from clipboard")
     else:
         QMessageBox.warning(None, "Clipboard", "No text to cut")
 
+class _ImageLoader(QRunnable):
+    """Decodes an image file on a pool thread, off the GUI event loop."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def run(self) -> None:
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(False)  # Skip EXIF orientation handling
+        img = reader.read()
+        # Queued back to the GUI thread, where the clipboard may be touched
+        signals.image_loaded.emit(img, reader.errorString() if img.isNull() else "")
+
 def copy_image() -> None:
     """Copy image to clipboard from file."""
     path, _ = QFileDialog.getOpenFileName(
         None, "Select Image", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
     )
     if path:
-        img = QImage(path)
-        if img.isNull():
-            QMessageBox.warning(None, "Error", "Invalid image file")
-        elif _with_retry(QApplication.clipboard().setImage, img):
-            QMessageBox.information(None, "Copied", "Image copied to clipboard")
-        else:
-            QMessageBox.warning(None, "Error", "Failed to copy image")
+        QThreadPool.globalInstance().start(_ImageLoader(path))
+
+def _on_image_loaded(img: QImage, error: str) -> None:
+    """Finish copy_image once the file has been decoded."""
+    if img.isNull():
+        QMessageBox.warning(None, "Error", f"Invalid image file: {error}")
+    else:
+        _clipboard.setImage(img)
+        _notify("Copied", "Image copied to clipboard")
+
+class _ImageSaver(QRunnable):
+    """Encodes and writes an image on a pool thread, off the GUI event loop."""
+
+    def __init__(self, img: QImage, path: str):
+        super().__init__()
+        self.img = img  # Implicitly shared; no pixel copy
+        self.path = path
+
+    def run(self) -> None:
+        signals.image_saved.emit(self.path, self.img.save(self.path))
 
 def paste_image() -> None:
     """Paste image from clipboard to file."""
-    img = QApplication.clipboard().image()
+    img = _clipboard.image()
     if img.isNull():
         QMessageBox.warning(None, "Clipboard", "No image in clipboard")
         return
@@ -277,84 +460,88 @@ def paste_image() -> None:
         None, "Save Image", "clipboard.png", "PNG Files (*.png)"
     )
     if path:
-        if img.save(path):
-            QMessageBox.information(None, "Saved", f"Image saved to {path}")
-        else:
-            QMessageBox.warning(None, "Error", "Failed to save image")
+        QThreadPool.globalInstance().start(_ImageSaver(img, path))
+
+def _on_image_saved(path: str, ok: bool) -> None:
+    """Finish paste_image once the file has been written."""
+    if ok:
+        _notify("Saved", f"Image saved to {path}")
+    else:
+        QMessageBox.warning(None, "Error", "Failed to save image")
 
 
 # ────────────────────────────────────────────────────────────────────
 # System-tray helpers
 # ────────────────────────────────────────────────────────────────────
-def make_tray_icon() -> Image.Image:
+def make_tray_icon() -> "Image.Image":
     """Create the system tray icon image."""
+    from PIL import Image, ImageDraw
+
     img = Image.new("RGBA", (64, 64), (50, 150, 250, 200))
     d = ImageDraw.Draw(img)
     d.ellipse((16, 16, 48, 48), fill="white")
     d.text((22, 20), "UB", fill=(50, 150, 250))
     return img
 
-def quit_app(icon: Icon, jiggler: MouseJiggler) -> None:
+def _tray_qicon() -> QIcon:
+    """Convert the PIL tray image into a QIcon."""
+    img = make_tray_icon()
+    data = img.tobytes("raw", "RGBA")  # Must outlive the QImage below
+    qimg = QImage(data, img.width, img.height, QImage.Format_RGBA8888)
+    return QIcon(QPixmap.fromImage(qimg))
+
+def quit_app(tray: QSystemTrayIcon, jiggler: MouseJiggler) -> None:
     """Clean up before quitting."""
-    icon.visible = False
+    tray.hide()
     jiggler.stop()
-    icon.stop()
     QApplication.quit()
     logger.info("Application exited cleanly")
 
-def start_tray(app: QApplication) -> None:
-    """Initialize and run the system tray icon."""
-    jiggler: MouseJiggler = app.property("jiggler")
+def start_tray(jiggler: MouseJiggler) -> None:
+    """Initialize and show the system tray icon."""
+    global _tray, _tray_menu
+
+    if not QSystemTrayIcon.isSystemTrayAvailable():
+        logger.error("Tray icon failed: no system tray available")
+        QApplication.quit()
+        return
 
-    def emit(signal):
-        return lambda: signal.emit()
+    tray = QSystemTrayIcon(_tray_qicon(), QApplication.instance())
+    tray.setToolTip(_TITLE_OFF)
+    menu = QMenu()
+
+    jiggler_action = menu.addAction(_LABEL_OFF)
 
     def toggle_jiggler():
         if jiggler.is_running():
             jiggler.pause()
         else:
             jiggler.start()
-        tray.title = f"{APP_NAME} - Jiggler: {'On' if jiggler.is_running() else 'Off'}"
-
-    tray = Icon(
-        APP_NAME,
-        make_tray_icon(),
-        title=f"{APP_NAME} - Jiggler: Off",
-        menu=Menu(
-            MenuItem(
-                lambda: "✔ Jiggler: On" if jiggler.is_running() else "◼ Jiggler: Off",
-                toggle_jiggler,
-                default=True
-            ),
-            Menu.SEPARATOR,
-            MenuItem("📋 Copy Text", emit(signals.copy)),
-            MenuItem("📋 Paste Text", emit(signals.paste)),
-            MenuItem("✂ Cut Text", emit(signals.cut)),
-            MenuItem("🖼 Copy Image", emit(signals.copy_image)),
-            MenuItem("🖼 Paste Image", emit(signals.paste_image)),
-            Menu.SEPARATOR,
-            MenuItem("⚙ Shortcuts", None, 
-                Menu(
-                    MenuItem("Copy Text", lambda: signals.custom_shortcut.emit("copy")),
-                    MenuItem("Paste Text", lambda: signals.custom_shortcut.emit("paste")),
-                    MenuItem("Cut Text", lambda: signals.custom_shortcut.emit("cut")),
-                    MenuItem("Copy Image", lambda: signals.custom_shortcut.emit("copy_image")),
-                    MenuItem("Paste Image", lambda: signals.custom_shortcut.emit("paste_image")),
-                )
-            ),
-            Menu.SEPARATOR,
-            MenuItem("❌ Exit", lambda: quit_app(tray, jiggler)),
-        ),
-    )
-
-    def run_tray():
-        try:
-            tray.run()
-        except Exception as e:
-            logger.error(f"Tray icon failed: {e}")
-            QTimer.singleShot(0, QApplication.quit)
-
-    threading.Thread(target=run_tray, daemon=True).start()
+        running = jiggler.is_running()
+        jiggler_action.setText(_LABEL_ON if running else _LABEL_OFF)
+        tray.setToolTip(_TITLE_ON if running else _TITLE_OFF)
+
+    jiggler_action.triggered.connect(toggle_jiggler)
+    menu.setDefaultAction(jiggler_action)
+    menu.addSeparator()
+    for name, icon, label in MENU_ACTIONS:
+        menu.addAction(f"{icon} {label}").triggered.connect(getattr(signals, name))
+    menu.addSeparator()
+    shortcuts_menu = menu.addMenu("⚙ Shortcuts")
+    for name, _, label in MENU_ACTIONS:
+        shortcuts_menu.addAction(label).triggered.connect(_SHORTCUT_EMIT[name])
+    menu.addSeparator()
+    menu.addAction("❌ Exit").triggered.connect(lambda: quit_app(tray, jiggler))
+
+    # Left click runs the default (jiggler) entry. On macOS a left click
+    # opens the menu and also reports Trigger, so toggling is menu-only there.
+    if not IS_DARWIN:
+        tray.activated.connect(
+            lambda reason: toggle_jiggler() if reason == QSystemTrayIcon.Trigger else None
+        )
+    tray.setContextMenu(menu)
+    tray.show()
+    _tray, _tray_menu = tray, menu
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -362,13 +549,15 @@ def start_tray(app: QApplication) -> None:
 # ────────────────────────────────────────────────────────────────────
 def main() -> None:
     """Application entry point."""
+    global _clipboard
+
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setQuitOnLastWindowClosed(False)
+    _clipboard = app.clipboard()
 
     # Initialize components
     jiggler = MouseJiggler()
-    app.setProperty("jiggler", jiggler)
 
     # Connect signals
     signals.copy.connect(copy_text)
@@ -376,6 +565,8 @@ def main() -> None:
     signals.cut.connect(cut_text)
     signals.copy_image.connect(copy_image)
     signals.paste_image.connect(paste_image)
+    signals.image_loaded.connect(_on_image_loaded)
+    signals.image_saved.connect(_on_image_saved)
 
     # Shortcut manager
     handlers = {
@@ -385,11 +576,12 @@ def main() -> None:
         "copy_image": signals.copy_image.emit,
         "paste_image": signals.paste_image.emit,
     }
-    ShortcutManager(app, handlers)
-    signals.custom_shortcut.connect(lambda action: app.property("shortcut_manager").set_shortcut(action))
+    shortcut_manager = ShortcutManager(app, handlers)
+    signals.custom_shortcut.connect(shortcut_manager.set_shortcut)
 
     # Start tray icon
-    QTimer.singleShot(0, lambda: start_tray(app))
+    QTimer.singleShot(0, lambda: start_tray(jiggler))
+    QTimer.singleShot(0, shortcut_manager.register_all)
 
     logger.info("Application started")
     sys.exit(app.exec_())